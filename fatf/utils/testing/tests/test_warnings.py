@@ -11,95 +11,114 @@ import pytest
 
 import fatf.utils.testing.warnings as testing_w
 
+MY_STR = 'my pattern'
+MY_RE = re.compile(MY_STR)
+MY_RE_I = re.compile(MY_STR, re.IGNORECASE)
+
+FLAG_M = re.compile('', re.MULTILINE)
+FLAG_I = re.compile('', re.IGNORECASE)
+FLAG_A = re.compile('', re.ASCII)
+FLAG_MI = re.compile('', re.MULTILINE | re.IGNORECASE)
+FLAG_MA = re.compile('', re.MULTILINE | re.ASCII)
+FLAG_AI = re.compile('', re.ASCII | re.IGNORECASE)
+
+VALUE_ERROR_TEMPLATE = (
+    'The input regular expression should {neg} be compiled with '
+    're.IGNORECASE flag -- it is imposed by the warning_filter_pattern '
+    'input variable.')
+MSG_YES = VALUE_ERROR_TEMPLATE.format(neg='')
+MSG_NO = VALUE_ERROR_TEMPLATE.format(neg='not')
+MSG_TYPE = (
+    'The warning filter module pattern should be either a string, a '
+    'regular expression pattern or a None type.')
+
+
+def assert_raises(error, error_message, pattern, ignore_case):
+    """
+    Checks the exception raised by ``handle_warnings_filter_pattern``.
+    """
+    with pytest.raises(error) as exin:
+        testing_w.handle_warnings_filter_pattern(
+            pattern, ignore_case=ignore_case)
+    assert str(exin.value) == error_message
+
+
+ACCEPT_CASES = [(None, False, testing_w.EMPTY_RE),
+                (None, True, testing_w.EMPTY_RE_I),
+                (MY_STR, False, MY_RE),
+                (MY_STR, True, MY_RE_I)]  # yapf: disable
+
+COMPILED_CASES = [(MY_RE, False),
+                  (MY_RE_I, True),
+                  (FLAG_M, False),
+                  (FLAG_I, True),
+                  (FLAG_A, False),
+                  (FLAG_MI, True),
+                  (FLAG_MA, False),
+                  (FLAG_AI, True)]  # yapf: disable
+
+REJECT_CASES = [
+    (MY_RE, True, ValueError, MSG_YES),
+    (MY_RE_I, False, ValueError, MSG_NO),
+    (4, False, TypeError, MSG_TYPE),
+    (2, True, TypeError, MSG_TYPE),
+    ([4, 2], False, TypeError, MSG_TYPE),
+    ([2, 4], True, TypeError, MSG_TYPE),
+    ({1: '4', 2: '2'}, False, TypeError, MSG_TYPE),
+    ({1: '4', 2: '2'}, True, TypeError, MSG_TYPE),
+    (FLAG_M, True, ValueError, MSG_YES),
+    (FLAG_I, False, ValueError, MSG_NO),
+    (FLAG_A, True, ValueError, MSG_YES),
+    (FLAG_MI, False, ValueError, MSG_NO),
+    (FLAG_MA, True, ValueError, MSG_YES),
+    (FLAG_AI, False, ValueError, MSG_NO)
+]  # yapf: disable
+
+
+@pytest.mark.parametrize('pattern,ignore_case,expected', ACCEPT_CASES)
+def test_handle_warnings_filter_pattern(pattern, ignore_case, expected):
+    """
+    Tests conversion of patterns in a warning filter.
+
+    Message and module parts of a warning filter are checked for ``None`` and
+    string inputs.
+    """
+    assert expected == testing_w.handle_warnings_filter_pattern(
+        pattern, ignore_case=ignore_case)
+
+
+@pytest.mark.parametrize('pattern,ignore_case', COMPILED_CASES)
+def test_handle_warnings_filter_pattern_compiled(pattern, ignore_case):
+    """
+    Tests handling of compiled patterns in a warning filter.
 
-def test_handle_warnings_filter_pattern():
+    A compiled regular expression (with various flags) that agrees with the
+    ``ignore_case`` parameter should be returned as is, without recompiling.
     """
-    Tests conversion and validation of patterns in a warning filter.
+    assert testing_w.handle_warnings_filter_pattern(
+        pattern, ignore_case=ignore_case) is pattern
 
-    Message and module parts of a warning filter are checked.
+
+@pytest.mark.parametrize('pattern,ignore_case,error,error_message',
+                         REJECT_CASES)
+def test_handle_warnings_filter_pattern_errors(pattern, ignore_case, error,
+                                               error_message):
+    """
+    Tests validation of patterns in a warning filter.
+
+    Compiled regular expressions whose ``re.IGNORECASE`` flag disagrees with
+    the ``ignore_case`` parameter and unsupported input types are checked.
     """
+    assert_raises(error, error_message, pattern, ignore_case)
+
 
-    def assert_correct_pattern(error, error_message, pattern, ignore_case):
-        with pytest.raises(error) as value_error:
-            testing_w.handle_warnings_filter_pattern(
-                pattern, ignore_case=ignore_case)
-        assert str(value_error.value) == error_message
-
-    # Test None
-    assert testing_w.EMPTY_RE == testing_w.handle_warnings_filter_pattern(
-        None, ignore_case=False)
-    assert testing_w.EMPTY_RE_I == testing_w.handle_warnings_filter_pattern(
-        None, ignore_case=True)
-
-    # Test string
-    my_str_pattern = 'my pattern'
-    my_re_pattern = re.compile(my_str_pattern)
-    my_re_pattern_i = re.compile(my_str_pattern, re.IGNORECASE)
-    assert my_re_pattern == testing_w.handle_warnings_filter_pattern(
-        my_str_pattern, ignore_case=False)
-    assert my_re_pattern_i == testing_w.handle_warnings_filter_pattern(
-        my_str_pattern, ignore_case=True)
-
-    # Test re.compile return type
-    assert my_re_pattern == testing_w.handle_warnings_filter_pattern(
-        my_re_pattern, ignore_case=False)
-
-    assert my_re_pattern_i == testing_w.handle_warnings_filter_pattern(
-        my_re_pattern_i, ignore_case=True)
-    value_error_message = (
-        'The input regular expression should {neg} be compiled with '
-        're.IGNORECASE flag -- it is imposed by the warning_filter_pattern '
-        'input variable.')
-    value_error_message_yes = value_error_message.format(neg='')
-    value_error_message_no = value_error_message.format(neg='not')
-    #
-    assert_correct_pattern(ValueError, value_error_message_yes, my_re_pattern,
-                           True)
-    assert_correct_pattern(ValueError, value_error_message_no, my_re_pattern_i,
-                           False)
-
-    # Test other types: int, list, dict
-    type_error_message = (
-        'The warning filter module pattern should be either a string, a '
-        'regular expression pattern or a None type.')
-    assert_correct_pattern(TypeError, type_error_message, 4, False)
-    assert_correct_pattern(TypeError, type_error_message, 2, True)
-    assert_correct_pattern(TypeError, type_error_message, [4, 2], False)
-    assert_correct_pattern(TypeError, type_error_message, [2, 4], True)
-    dict_example = {1: '4', 2: '2'}
-    assert_correct_pattern(TypeError, type_error_message, dict_example, False)
-    assert_correct_pattern(TypeError, type_error_message, dict_example, True)
-
-    # Test other regex flags
-    flag_m = re.compile('', re.MULTILINE)
-    assert flag_m == testing_w.handle_warnings_filter_pattern(
-        flag_m, ignore_case=False)
-    assert_correct_pattern(ValueError, value_error_message_yes, flag_m, True)
-    #
-    flag_i = re.compile('', re.IGNORECASE)
-    assert flag_i == testing_w.handle_warnings_filter_pattern(
-        flag_i, ignore_case=True)
-    assert_correct_pattern(ValueError, value_error_message_no, flag_i, False)
-    #
-    flag_a = re.compile('', re.ASCII)
-    assert flag_a == testing_w.handle_warnings_filter_pattern(
-        flag_a, ignore_case=False)
-    assert_correct_pattern(ValueError, value_error_message_yes, flag_m, True)
-    #
-    flag_mi = re.compile('', re.MULTILINE | re.IGNORECASE)
-    assert flag_mi == testing_w.handle_warnings_filter_pattern(
-        flag_mi, ignore_case=True)
-    assert_correct_pattern(ValueError, value_error_message_no, flag_mi, False)
-    #
-    flag_ma = re.compile('', re.MULTILINE | re.ASCII)
-    assert flag_ma == testing_w.handle_warnings_filter_pattern(
-        flag_ma, ignore_case=False)
-    assert_correct_pattern(ValueError, value_error_message_yes, flag_ma, True)
-    #
-    flag_ai = re.compile('', re.ASCII | re.IGNORECASE)
-    assert flag_ai == testing_w.handle_warnings_filter_pattern(
-        flag_ai, ignore_case=True)
-    assert_correct_pattern(ValueError, value_error_message_no, flag_ai, False)
+EXPECTED_DEFAULTS = [
+    (fltr[0],
+     testing_w.handle_warnings_filter_pattern(fltr[1], ignore_case=True),
+     fltr[2],
+     testing_w.handle_warnings_filter_pattern(fltr[3], ignore_case=False),
+     fltr[4]) for fltr in testing_w.DEFAULT_WARNINGS
+]  # yapf: disable
 
 
 def test_set_default_warning_filters():
@@ -108,99 +127,68 @@ def test_set_default_warning_filters():
     """
     testing_w.set_default_warning_filters()
 
-    filters_number = len(testing_w.DEFAULT_WARNINGS)
-    assert len(warnings.filters) == filters_number
-
-    for i in range(filters_number):
-        builtin_filter = warnings.filters[i]
-        default_filter = testing_w.DEFAULT_WARNINGS[filters_number - 1 - i]
+    assert len(warnings.filters) == len(EXPECTED_DEFAULTS)
 
+    # The default filters are appended, hence stored in the reversed order
+    for builtin_filter, default_filter in zip(warnings.filters,
+                                              reversed(EXPECTED_DEFAULTS)):
         # Compare warning action
         assert builtin_filter[0] == default_filter[0]
         # Compare message
-        assert (testing_w.handle_warnings_filter_pattern(
-            builtin_filter[1],
-            ignore_case=True) == testing_w.handle_warnings_filter_pattern(
-                default_filter[1], ignore_case=True))
+        assert testing_w.handle_warnings_filter_pattern(
+            builtin_filter[1], ignore_case=True) == default_filter[1]
         # Compare warning category
         assert builtin_filter[2] == default_filter[2]
         # Compare module
-        assert (testing_w.handle_warnings_filter_pattern(
-            builtin_filter[3],
-            ignore_case=False) == testing_w.handle_warnings_filter_pattern(
-                default_filter[3], ignore_case=False))
+        assert testing_w.handle_warnings_filter_pattern(
+            builtin_filter[3], ignore_case=False) == default_filter[3]
         # Compare lineno
         assert builtin_filter[4] == default_filter[4]
 
 
-def test_is_warning_class_displayed():
-    """
-    Tests a function responsible for checking warning filters setup.
-
-    This function tests whether a function responsible for checking whether a
-    particular warning class is displayed based on the available warning
-    filters behaves as expected.
-    """
+DW = DeprecationWarning
+IS_DISPLAYED_CASES = [
     # No warning filters -> display
-    warnings.resetwarnings()
-    assert testing_w.is_warning_class_displayed(DeprecationWarning)
-
+    ([], None, True),
     # No filter for this particular class -> display
-    warnings.filterwarnings('default', category=ImportWarning, module='')
-    assert testing_w.is_warning_class_displayed(DeprecationWarning)
-
+    ([('default', ImportWarning, '')], None, True),
     # A filter that blocks -> do not display
-    warnings.resetwarnings()
-    warnings.filterwarnings('ignore', category=DeprecationWarning, module='')
-    assert not testing_w.is_warning_class_displayed(DeprecationWarning)
-
+    ([('ignore', DW, '')], None, False),
     # A filter that allows -> display
-    warnings.resetwarnings()
-    warnings.filterwarnings('default', category=DeprecationWarning, module='')
-    assert testing_w.is_warning_class_displayed(DeprecationWarning)
-    #
-    warnings.resetwarnings()
-    warnings.filterwarnings('error', category=DeprecationWarning, module='')
-    assert testing_w.is_warning_class_displayed(DeprecationWarning)
-    #
-    warnings.resetwarnings()
-    warnings.filterwarnings('always', category=DeprecationWarning, module='')
-    assert testing_w.is_warning_class_displayed(DeprecationWarning)
-    #
-    warnings.resetwarnings()
-    warnings.filterwarnings('module', category=DeprecationWarning, module='')
-    assert testing_w.is_warning_class_displayed(DeprecationWarning)
-    #
-    warnings.resetwarnings()
-    warnings.filterwarnings('module', category=DeprecationWarning, module='')
-    assert testing_w.is_warning_class_displayed(DeprecationWarning)
-
+    ([('default', DW, '')], None, True),
+    ([('error', DW, '')], None, True),
+    ([('always', DW, '')], None, True),
+    ([('module', DW, '')], None, True),
+    ([('once', DW, '')], None, True),
     # A block filter that overwrites another (pass) filter -> do not display
-    warnings.resetwarnings()
-    warnings.filterwarnings('always', category=DeprecationWarning, module='')
-    warnings.filterwarnings('ignore', category=DeprecationWarning, module='')
-    assert not testing_w.is_warning_class_displayed(DeprecationWarning)
-
+    ([('always', DW, ''), ('ignore', DW, '')], None, False),
     # A pass filter that overwrites another (block) filter -> display
-    warnings.resetwarnings()
-    warnings.filterwarnings('ignore', category=DeprecationWarning, module='')
-    warnings.filterwarnings('always', category=DeprecationWarning, module='')
-    assert testing_w.is_warning_class_displayed(DeprecationWarning)
-
+    ([('ignore', DW, ''), ('always', DW, '')], None, True),
     # A filter with t namespace
-    warnings.resetwarnings()
-    warnings.filterwarnings('ignore', category=DeprecationWarning, module='t')
-    assert testing_w.is_warning_class_displayed(DeprecationWarning,
-                                                'fatf.test.t')
-    assert not testing_w.is_warning_class_displayed(DeprecationWarning,
-                                                    't.test')
-    warnings.filterwarnings(
-        'ignore', category=DeprecationWarning, module='fatf')
-    assert not testing_w.is_warning_class_displayed(DeprecationWarning,
-                                                    'fatf.test.t')
-    warnings.filterwarnings(
-        'always', category=DeprecationWarning, module='fatf.test')
-    assert not testing_w.is_warning_class_displayed(DeprecationWarning,
-                                                    'fatf.t')
-    assert testing_w.is_warning_class_displayed(DeprecationWarning,
-                                                'fatf.test.t')
+    ([('ignore', DW, 't')], 'fatf.test.t', True),
+    ([('ignore', DW, 't')], 't.test', False),
+    ([('ignore', DW, 't'), ('ignore', DW, 'fatf')], 'fatf.test.t', False),
+    ([('ignore', DW, 't'), ('ignore', DW, 'fatf'),
+      ('always', DW, 'fatf.test')], 'fatf.t', False),
+    ([('ignore', DW, 't'), ('ignore', DW, 'fatf'),
+      ('always', DW, 'fatf.test')], 'fatf.test.t', True)
+]  # yapf: disable
+
+
+@pytest.mark.parametrize('filters,module,expected', IS_DISPLAYED_CASES)
+def test_is_warning_class_displayed(filters, module, expected):
+    """
+    Tests a function responsible for checking warning filters setup.
+
+    This function tests whether a function responsible for checking whether a
+    particular warning class is displayed based on the available warning
+    filters behaves as expected. Each scenario is run on a fresh (empty) list
+    of warning filters, which is restored afterwards.
+    """
+    with warnings.catch_warnings():
+        warnings.resetwarnings()
+        for action, category, filter_module in filters:
+            warnings.filterwarnings(
+                action, category=category, module=filter_module)
+        assert testing_w.is_warning_class_displayed(
+            DeprecationWarning, module) is expected